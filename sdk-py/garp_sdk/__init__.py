@@ -1,9 +1,13 @@
-from .client import GarpClient, SimulationResult
+from .aio import AsyncGarpClient, install_uvloop
+from .client import GarpClient, SimulationResult, make_http_client
 from .types import BlockInfo, TransactionInfo
 
 __all__ = [
+    "AsyncGarpClient",
     "GarpClient",
     "SimulationResult",
+    "make_http_client",
+    "install_uvloop",
     "BlockInfo",
     "TransactionInfo",
 ]
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Internal JSON helpers.
+
+Uses orjson when available for fast (de)serialization of RPC bodies;
+falls back to the stdlib json module so the SDK stays importable in
+minimal environments. Both paths expose bytes-in/bytes-out `_dumps`
+and a `_loads` that accepts bytes.
+"""
+
+try:
+    import orjson as _orjson
+
+    _dumps = _orjson.dumps
+    _loads = _orjson.loads
+except ImportError:  # pragma: no cover
+    import json as _stdlib_json
+
+    def _dumps(obj):
+        return _stdlib_json.dumps(obj).encode("utf-8")
+
+    _loads = _stdlib_json.loads
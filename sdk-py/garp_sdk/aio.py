@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from itertools import count
+from typing import Any, List, Optional, Union
+
+import httpx
+from ._json import _loads
+from .client import SimulationResult, _DECODERS, _SOCKET_OPTIONS, _encode_tx, _noparam_body, _param_body
+from .types import BlockInfo, TransactionInfo
+
+_JSON_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+
+
+def install_uvloop() -> bool:
+    """Install uvloop as the asyncio event-loop policy when available.
+
+    Call once at startup, before any event loop or AsyncGarpClient is
+    created; uvloop's loop implementation noticeably cuts per-await
+    overhead for RPC-heavy workloads. Returns False and leaves the
+    default loop in place when uvloop is not installed (it is an
+    optional extra and unavailable on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+class AsyncGarpClient:
+    """Async counterpart of GarpClient over httpx.AsyncClient.
+
+    Independent RPCs should be issued concurrently with `rpc_many` (or
+    plain `asyncio.gather` over the coroutine methods) so their network
+    waits overlap instead of accumulating serially.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.base_url = base_url.rstrip('/')
+        self._rpc_url = self.base_url + "/rpc"
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+                socket_options=_SOCKET_OPTIONS,
+            ),
+            timeout=timeout,
+            headers=_JSON_HEADERS,
+        )
+        # Lock-free unique ids for in-flight concurrent requests.
+        self._ids = count(1)
+
+    async def __aenter__(self) -> "AsyncGarpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _rpc(self, method: str, params: Optional[list] = None) -> Any:
+        """Make an RPC call to the GARP node."""
+        if params is None:
+            data = _noparam_body(method)
+        else:
+            data = _param_body(method, next(self._ids), params)
+
+        response = await self.client.post(self._rpc_url, content=data)
+        response.raise_for_status()
+
+        result = _loads(response.content)
+        if "error" in result:
+            raise Exception(f"RPC error: {result['error']}")
+
+        return result.get("result")
+
+    async def _rpc_typed(self, method: str, params: list) -> Any:
+        """Like _rpc, but decodes the response body with the method's pre-built
+        typed decoder from _DECODERS."""
+        decoder = _DECODERS[method]
+        data = _param_body(method, next(self._ids), params)
+
+        response = await self.client.post(self._rpc_url, content=data)
+        response.raise_for_status()
+
+        envelope = decoder.decode(response.content)
+        if envelope.error is not None:
+            raise Exception(f"RPC error: {envelope.error}")
+
+        return envelope.result
+
+    async def _rpc_raw(self, method: str, params: list) -> bytes:
+        """RPC call that returns the raw response body without decoding."""
+        data = _param_body(method, next(self._ids), params)
+
+        response = await self.client.post(self._rpc_url, content=data)
+        response.raise_for_status()
+
+        return response.content
+
+    async def rpc_many(self, calls: list) -> list:
+        """Run several RPC calls concurrently and return results in order.
+
+        Each entry is `{"method": ..., "params": [...]}` as in
+        `GarpClient.batch`; the calls are awaited together so N requests
+        take one round trip of wall time, not N.
+        """
+        return await asyncio.gather(
+            *(self._rpc(call["method"], call.get("params")) for call in calls)
+        )
+
+    # Timing & consensus
+    async def get_slot(self) -> int:
+        return await self._rpc("getSlot")
+
+    async def get_slot_leader(self) -> str:
+        return await self._rpc("getSlotLeader")
+
+    # Blocks
+    async def get_block_by_slot(self, slot: int) -> Optional[BlockInfo]:
+        return await self._rpc_typed("getBlock", [slot])
+
+    async def get_block_by_hash(self, hash_hex: str) -> Optional[BlockInfo]:
+        return await self._rpc_typed("getBlock", [hash_hex])
+
+    async def get_blocks(self, slots: List[int]) -> List[Optional[BlockInfo]]:
+        """Fetch many blocks concurrently instead of awaiting one by one."""
+        return await asyncio.gather(*(self.get_block_by_slot(slot) for slot in slots))
+
+    # Transactions
+    async def get_transaction(self, tx_id_hex: str) -> Optional[TransactionInfo]:
+        return await self._rpc_typed("getTransaction", [tx_id_hex])
+
+    async def get_transactions(self, tx_ids: List[str]) -> List[Optional[TransactionInfo]]:
+        """Fetch many transactions concurrently instead of awaiting one by one."""
+        return await asyncio.gather(*(self.get_transaction(tx_id) for tx_id in tx_ids))
+
+    async def send_transaction_raw(self, tx_serialized: Union[str, bytes]) -> str:
+        return await self._rpc("sendTransaction", [_encode_tx(tx_serialized)])
+
+    async def send_transaction_raw_bytes(self, tx_serialized: Union[str, bytes]) -> bytes:
+        """Send a pre-serialized transaction and return the raw JSON-RPC
+        response body undecoded, for callers that forward or archive the
+        bytes verbatim. Raw bytes input is base64-encoded on the wire."""
+        return await self._rpc_raw("sendTransaction", [_encode_tx(tx_serialized)])
+
+    async def simulate_transaction_raw(self, tx_serialized: Union[str, bytes]) -> SimulationResult:
+        return await self._rpc_typed("simulateTransaction", [_encode_tx(tx_serialized)])
+
+    async def simulate_transaction_raw_bytes(self, tx_serialized: Union[str, bytes]) -> bytes:
+        """Simulate a pre-serialized transaction and return the raw JSON-RPC
+        response body undecoded. Raw bytes input is base64-encoded on the wire."""
+        return await self._rpc_raw("simulateTransaction", [_encode_tx(tx_serialized)])
+
+    # Wallets
+    async def get_balance(self, address_hex: str) -> int:
+        """Return the balance in base units as an int.
+
+        The node may serialize large balances as decimal strings; they are
+        parsed once here so call sites stop re-doing str-to-int conversion.
+        """
+        balance = await self._rpc("getBalance", [address_hex])
+        return balance if isinstance(balance, int) else int(balance)
+
+    # Node info
+    async def get_version(self) -> str:
+        return await self._rpc("getVersion")
+
+    async def get_health(self) -> str:
+        return await self._rpc("getHealth")
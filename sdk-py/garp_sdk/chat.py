@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import httpx
+from msgspec import Struct
+from msgspec import json as _msjson
 
+from ._json import _dumps, _loads
+from .client import make_http_client
 
-@dataclass
-class Message:
+
+class Message(Struct, gc=False):
     id: int
     sender: str
     recipient: str
@@ -20,17 +23,30 @@ class Message:
     block_number: Optional[int] = None
 
 
+# Decodes the /messages response body straight into typed Message objects
+# without an intermediate list of dicts.
+_MSG_LIST_DEC = _msjson.Decoder(List[Message])
+
+
 class ChatClient:
     """
     REST client for chat endpoints via gateway '/api'.
     """
 
-    def __init__(self, base_url: str, timeout: float = 10.0):
+    def __init__(self, base_url: str, timeout: float = 10.0, client: Optional[httpx.Client] = None):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.Client(timeout=timeout)
+        self._messages_url = self.base_url + "/messages"
+        self._signals_url = self.base_url + "/signals"
+        if client is not None:
+            self.client = client
+            self._owns_client = False
+        else:
+            self.client = make_http_client(timeout)
+            self._owns_client = True
 
     def close(self) -> None:
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
 
     def send_message(self, sender: str, recipient: str, ciphertext: str, nonce: str) -> Dict[str, Any]:
         body = {
@@ -39,9 +55,9 @@ class ChatClient:
             "content_ciphertext": ciphertext,
             "content_nonce": nonce,
         }
-        resp = self.client.post(f"{self.base_url}/messages", json=body)
+        resp = self.client.post(self._messages_url, content=_dumps(body))
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     def list_messages(self, address: str, peer: str, since: Optional[str] = None, limit: Optional[int] = None) -> List[Message]:
         params: Dict[str, Any] = {"address": address, "peer": peer}
@@ -49,18 +65,17 @@ class ChatClient:
             params["since"] = since
         if limit and limit > 0:
             params["limit"] = limit
-        resp = self.client.get(f"{self.base_url}/messages", params=params)
+        resp = self.client.get(self._messages_url, params=params)
         resp.raise_for_status()
-        arr = resp.json()
-        return [Message(**item) for item in arr]
+        return _MSG_LIST_DEC.decode(resp.content)
 
     def get_public_key(self, addr: str) -> Dict[str, str]:
         resp = self.client.get(f"{self.base_url}/keys/{addr}")
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     def send_signal(self, from_addr: str, to_addr: str, type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         body = {"from": from_addr, "to": to_addr, "type": type, "payload": payload}
-        resp = self.client.post(f"{self.base_url}/signals", json=body)
+        resp = self.client.post(self._signals_url, content=_dumps(body))
         resp.raise_for_status()
-        return resp.json()
\ No newline at end of file
+        return _loads(resp.content)
\ No newline at end of file
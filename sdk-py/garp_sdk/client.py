@@ -1,84 +1,374 @@
-import json
-import requests
-from typing import Optional, Dict, Any, Union
-from dataclasses import dataclass
+import base64
+import httpx
+import socket
+from cachetools import LRUCache
+from contextlib import contextmanager
+from itertools import count
+from typing import Optional, Dict, Any, Generic, TypeVar, Union
+from msgspec import Struct
+from msgspec import json as _msjson
+from ._json import _dumps, _loads
 from .types import BlockInfo, TransactionInfo
 
-@dataclass
-class SimulationResult:
+_JSON_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+
+# Disable Nagle's algorithm so small RPC payloads go out immediately, and
+# keep idle pooled connections alive at the TCP level.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+class SimulationResult(Struct, gc=False):
     ok: bool
     logs: Optional[list] = None
     error: Optional[str] = None
 
+_T = TypeVar("_T")
+
+class _RpcError(Struct):
+    code: Optional[int] = None
+    message: Optional[str] = None
+    data: Optional[Any] = None
+
+class _RpcEnvelope(Struct, Generic[_T]):
+    """JSON-RPC response envelope decoded straight into the typed result."""
+    result: Optional[_T] = None
+    error: Optional[_RpcError] = None
+
+# Pre-built decoders so the hot read path skips the intermediate dict
+# and per-field kwargs construction entirely.
+_BLOCK_DEC = _msjson.Decoder(_RpcEnvelope[BlockInfo])
+_TX_DEC = _msjson.Decoder(_RpcEnvelope[TransactionInfo])
+_SIM_DEC = _msjson.Decoder(_RpcEnvelope[SimulationResult])
+
+# Method -> decoder table; typed RPC helpers look their decoder up here
+# instead of having callers thread decoder objects through every call.
+_DECODERS: Dict[str, _msjson.Decoder] = {
+    "getBlock": _BLOCK_DEC,
+    "getTransaction": _TX_DEC,
+    "simulateTransaction": _SIM_DEC,
+}
+
+# Serialized request bodies for fixed-method, no-param calls (getSlot,
+# getVersion, ...). The JSON-RPC id only disambiguates batch responses,
+# so a constant id is fine for single requests and the bytes can be
+# reused verbatim.
+_NOPARAM_BODIES: Dict[str, bytes] = {}
+
+def _noparam_body(method: str) -> bytes:
+    body = _NOPARAM_BODIES.get(method)
+    if body is None:
+        body = _dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": []})
+        _NOPARAM_BODIES[method] = body
+    return body
+
+# Static body prefixes for parameterized calls, keyed by method. Only the
+# id digits and the params array vary per request, so the fixed fields are
+# serialized once and the body is assembled by bytes concatenation instead
+# of re-serializing the whole payload dict.
+_PARAM_PREFIXES: Dict[str, bytes] = {}
+
+def _encode_tx(tx_serialized: Union[str, bytes]) -> str:
+    """Encode a serialized transaction for the JSON-RPC params array.
+
+    Hex str payloads pass through unchanged; raw bytes are base64-encoded,
+    which is ~25% smaller on the wire than the equivalent hex string.
+    """
+    if isinstance(tx_serialized, str):
+        return tx_serialized
+    return base64.b64encode(tx_serialized).decode("ascii")
+
+def _param_body(method: str, rpc_id: int, params: list) -> bytes:
+    prefix = _PARAM_PREFIXES.get(method)
+    if prefix is None:
+        prefix = b'{"jsonrpc":"2.0","method":' + _dumps(method) + b',"id":'
+        _PARAM_PREFIXES[method] = prefix
+    return b'%b%d,"params":%b}' % (prefix, rpc_id, _dumps(params))
+
+def make_http_client(timeout: float = 10.0) -> httpx.Client:
+    """Build an httpx.Client tuned for GARP endpoints.
+
+    Pass the same instance to several GarpClient/ChatClient constructors
+    to share one connection pool (and its keep-alive TCP/TLS state)
+    across them.
+    """
+    return httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            socket_options=_SOCKET_OPTIONS,
+        ),
+        timeout=timeout,
+        headers=_JSON_HEADERS,
+    )
+
+class PipelinedResult:
+    """Placeholder returned by RPC calls made inside `GarpClient.pipeline()`.
+
+    The value is available via `result()` once the pipeline block exits.
+    """
+    __slots__ = ("_value", "_resolved")
+
+    def __init__(self):
+        self._value = None
+        self._resolved = False
+
+    def _resolve(self, value: Any) -> None:
+        self._value = value
+        self._resolved = True
+
+    def result(self) -> Any:
+        if not self._resolved:
+            raise RuntimeError("pipelined result is not available until the pipeline() block exits")
+        return self._value
+
 class GarpClient:
-    def __init__(self, base_url: str, timeout: float = 10.0):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        cache_finalized: bool = True,
+        finality_depth: int = 32,
+        client: Optional[httpx.Client] = None,
+    ):
         self.base_url = base_url.rstrip('/')
+        # Endpoint URLs are fixed for the life of the client; build them
+        # once instead of re-concatenating on every request.
+        self._rpc_url = self.base_url + "/rpc"
+        self._bridge_transfer_url = self.base_url + "/api/v1/bridge/transfer"
+        self._bridge_assets_url = self.base_url + "/api/v1/bridge/assets"
         self.timeout = timeout
-        self.session = requests.Session()
-        
+        if client is not None:
+            self.client = client
+            self._owns_client = False
+        else:
+            self.client = make_http_client(timeout)
+            self._owns_client = True
+        self._pipeline_buffer: Optional[list] = None
+        # itertools.count increments atomically under the GIL, so ids stay
+        # unique across threads without a lock.
+        self._ids = count(1)
+        self.cache_finalized = cache_finalized
+        self.finality_depth = finality_depth
+        self._cache: LRUCache = LRUCache(maxsize=4096)
+        self._last_seen_slot = 0
+
+    def close(self) -> None:
+        if self._owns_client:
+            self.client.close()
+
+    def invalidate(self) -> None:
+        """Drop all locally cached RPC results."""
+        self._cache.clear()
+
     def _rpc(self, method: str, params: Optional[list] = None) -> Any:
         """Make an RPC call to the GARP node."""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params or []
-        }
-        
-        response = self.session.post(
-            f"{self.base_url}/rpc",
-            json=payload,
-            timeout=self.timeout
-        )
+        if self._pipeline_buffer is not None:
+            placeholder = PipelinedResult()
+            self._pipeline_buffer.append((method, params or [], placeholder))
+            return placeholder
+
+        if params is None:
+            data = _noparam_body(method)
+        else:
+            data = _param_body(method, next(self._ids), params)
+
+        response = self.client.post(self._rpc_url, content=data)
         response.raise_for_status()
-        
-        result = response.json()
+
+        result = _loads(response.content)
         if "error" in result:
             raise Exception(f"RPC error: {result['error']}")
-            
+
         return result.get("result")
-    
+
+    def _rpc_typed(self, method: str, params: list) -> Any:
+        """Like _rpc, but decodes the response body with the method's pre-built
+        typed decoder from _DECODERS."""
+        decoder = _DECODERS[method]
+        data = _param_body(method, next(self._ids), params)
+
+        response = self.client.post(self._rpc_url, content=data)
+        response.raise_for_status()
+
+        envelope = decoder.decode(response.content)
+        if envelope.error is not None:
+            raise Exception(f"RPC error: {envelope.error}")
+
+        return envelope.result
+
+    def _rpc_raw(self, method: str, params: list) -> bytes:
+        """RPC call that returns the raw response body without decoding.
+
+        The bytes come straight from the response buffer, so consumers that
+        only relay the envelope skip the parse/re-serialize round trip.
+        """
+        data = _param_body(method, next(self._ids), params)
+
+        response = self.client.post(self._rpc_url, content=data)
+        response.raise_for_status()
+
+        return response.content
+
+    def _rpc_typed_stream(self, method: str, params: list) -> Any:
+        """Typed RPC for potentially large responses (blocks with full
+        transaction lists). The body is read incrementally into one growing
+        buffer and decoded in a single pass, avoiding the extra full-body
+        copy that `response.content` makes for multi-chunk responses.
+        """
+        decoder = _DECODERS[method]
+        data = _param_body(method, next(self._ids), params)
+
+        with self.client.stream("POST", self._rpc_url, content=data) as response:
+            response.raise_for_status()
+            buf = bytearray()
+            for chunk in response.iter_bytes():
+                buf += chunk
+
+        envelope = decoder.decode(buf)
+        if envelope.error is not None:
+            raise Exception(f"RPC error: {envelope.error}")
+
+        return envelope.result
+
+    @contextmanager
+    def pipeline(self):
+        """Defer RPC calls inside the block and send them as one batch POST.
+
+        Calls that go through `_rpc` (get_slot, get_balance, get_version, ...)
+        return a PipelinedResult placeholder instead of a value; on block
+        exit all buffered calls are sent as a single JSON-RPC batch array,
+        responses are matched back by id, and each placeholder's `result()`
+        becomes available. Typed reads such as `get_block_by_slot` are not
+        deferred and execute immediately.
+        """
+        if self._pipeline_buffer is not None:
+            raise RuntimeError("pipeline() blocks cannot be nested")
+        self._pipeline_buffer = []
+        try:
+            yield self
+            buffered = self._pipeline_buffer
+            self._pipeline_buffer = None
+            if buffered:
+                self._flush_pipeline(buffered)
+        finally:
+            self._pipeline_buffer = None
+
+    def _flush_pipeline(self, buffered: list) -> None:
+        buf = bytearray(b"[")
+        for i, (method, params, _) in enumerate(buffered):
+            if i:
+                buf += b","
+            buf += _param_body(method, i + 1, params)
+        buf += b"]"
+
+        response = self.client.post(self._rpc_url, content=bytes(buf))
+        response.raise_for_status()
+
+        by_id = {entry.get("id"): entry for entry in _loads(response.content)}
+        for i, (_, _, placeholder) in enumerate(buffered):
+            entry = by_id.get(i + 1, {})
+            if "error" in entry:
+                raise Exception(f"RPC error: {entry['error']}")
+            placeholder._resolve(entry.get("result"))
+
     # Timing & consensus
     def get_slot(self) -> int:
-        return self._rpc("getSlot")
-    
+        slot = self._rpc("getSlot")
+        if isinstance(slot, int) and slot > self._last_seen_slot:
+            self._last_seen_slot = slot
+        return slot
+
     def get_slot_leader(self) -> str:
         return self._rpc("getSlotLeader")
-    
+
     # Blocks
     def get_block_by_slot(self, slot: int) -> Optional[BlockInfo]:
-        result = self._rpc("getBlock", [slot])
-        if result is None:
-            return None
-        return BlockInfo(**result)
-    
+        key = ("block", slot)
+        if self.cache_finalized:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        block = self._rpc_typed_stream("getBlock", [slot])
+        if block is not None:
+            if block.slot > self._last_seen_slot:
+                self._last_seen_slot = block.slot
+            # Only cache slots deep enough below the tip to be finalized.
+            if self.cache_finalized and slot <= self._last_seen_slot - self.finality_depth:
+                self._cache[key] = block
+        return block
+
     def get_block_by_hash(self, hash_hex: str) -> Optional[BlockInfo]:
-        result = self._rpc("getBlock", [hash_hex])
-        if result is None:
-            return None
-        return BlockInfo(**result)
-    
+        key = ("block", hash_hex)
+        if self.cache_finalized:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        block = self._rpc_typed_stream("getBlock", [hash_hex])
+        if self.cache_finalized and block is not None:
+            self._cache[key] = block
+        return block
+
     # Transactions
     def get_transaction(self, tx_id_hex: str) -> Optional[TransactionInfo]:
-        result = self._rpc("getTransaction", [tx_id_hex])
-        if result is None:
-            return None
-        return TransactionInfo(**result)
-    
-    def send_transaction_raw(self, tx_serialized: str) -> str:
-        return self._rpc("sendTransaction", [tx_serialized])
-    
-    def simulate_transaction_raw(self, tx_serialized: str) -> SimulationResult:
-        result = self._rpc("simulateTransaction", [tx_serialized])
-        return SimulationResult(**result)
+        key = ("tx", tx_id_hex)
+        if self.cache_finalized:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        tx = self._rpc_typed("getTransaction", [tx_id_hex])
+        if self.cache_finalized and tx is not None:
+            self._cache[key] = tx
+        return tx
+
+    def send_transaction_raw(self, tx_serialized: Union[str, bytes]) -> str:
+        return self._rpc("sendTransaction", [_encode_tx(tx_serialized)])
+
+    def send_transaction_raw_bytes(self, tx_serialized: Union[str, bytes]) -> bytes:
+        """Send a pre-serialized transaction and return the raw JSON-RPC
+        response body undecoded, for callers that forward or archive the
+        bytes verbatim. Raw bytes input is base64-encoded on the wire."""
+        return self._rpc_raw("sendTransaction", [_encode_tx(tx_serialized)])
+
+    def simulate_transaction_raw(self, tx_serialized: Union[str, bytes]) -> SimulationResult:
+        return self._rpc_typed("simulateTransaction", [_encode_tx(tx_serialized)])
+
+    def simulate_transaction_raw_bytes(self, tx_serialized: Union[str, bytes]) -> bytes:
+        """Simulate a pre-serialized transaction and return the raw JSON-RPC
+        response body undecoded. Raw bytes input is base64-encoded on the wire."""
+        return self._rpc_raw("simulateTransaction", [_encode_tx(tx_serialized)])
     
     # Wallets
-    def get_balance(self, address_hex: str) -> Union[str, int]:
-        return self._rpc("getBalance", [address_hex])
+    def get_balance(self, address_hex: str) -> int:
+        """Return the balance in base units as an int.
+
+        The node may serialize large balances as decimal strings; they are
+        parsed once here so call sites stop re-doing str-to-int conversion.
+        """
+        balance = self._rpc("getBalance", [address_hex])
+        if isinstance(balance, PipelinedResult):
+            return balance
+        return balance if isinstance(balance, int) else int(balance)
     
     # Node info
     def get_version(self) -> str:
-        return self._rpc("getVersion")
+        if self._pipeline_buffer is not None:
+            # Deferred call: bypass the cache entirely so a PipelinedResult
+            # placeholder is never stored or served as the version.
+            return self._rpc("getVersion")
+        if self.cache_finalized:
+            cached = self._cache.get("version")
+            if cached is not None:
+                return cached
+        version = self._rpc("getVersion")
+        if self.cache_finalized and version is not None:
+            self._cache["version"] = version
+        return version
     
     def get_health(self) -> str:
         return self._rpc("getHealth")
@@ -105,14 +395,10 @@ class GarpClient:
             "asset_id": asset_id
         }
         
-        response = self.session.post(
-            f"{self.base_url}/api/v1/bridge/transfer",
-            json=payload,
-            timeout=self.timeout
-        )
+        response = self.client.post(self._bridge_transfer_url, content=_dumps(payload))
         response.raise_for_status()
-        
-        result = response.json()
+
+        result = _loads(response.content)
         if not result.get("success"):
             raise Exception(f"Bridge transfer failed: {result.get('error')}")
             
@@ -120,13 +406,10 @@ class GarpClient:
     
     def get_bridge_transfer_status(self, bridge_tx_id: str) -> str:
         """Get the status of a bridge transfer."""
-        response = self.session.get(
-            f"{self.base_url}/api/v1/bridge/transfer/{bridge_tx_id}/status",
-            timeout=self.timeout
-        )
+        response = self.client.get(f"{self._bridge_transfer_url}/{bridge_tx_id}/status")
         response.raise_for_status()
-        
-        result = response.json()
+
+        result = _loads(response.content)
         if not result.get("success"):
             raise Exception(f"Failed to get bridge transfer status: {result.get('error')}")
             
@@ -149,14 +432,10 @@ class GarpClient:
             "conversion_rate": conversion_rate
         }
         
-        response = self.session.post(
-            f"{self.base_url}/api/v1/bridge/assets",
-            json=payload,
-            timeout=self.timeout
-        )
+        response = self.client.post(self._bridge_assets_url, content=_dumps(payload))
         response.raise_for_status()
-        
-        result = response.json()
+
+        result = _loads(response.content)
         return result.get("success", False)
     
     def get_asset_mapping(
@@ -166,13 +445,10 @@ class GarpClient:
         target_chain: str
     ) -> Optional[Dict[str, Any]]:
         """Get an asset mapping between chains."""
-        response = self.session.get(
-            f"{self.base_url}/api/v1/bridge/assets/{source_chain}/{source_asset_id}/{target_chain}",
-            timeout=self.timeout
-        )
+        response = self.client.get(f"{self._bridge_assets_url}/{source_chain}/{source_asset_id}/{target_chain}")
         response.raise_for_status()
-        
-        result = response.json()
+
+        result = _loads(response.content)
         if not result.get("success"):
             return None
             
@@ -181,21 +457,18 @@ class GarpClient:
     # Batch requests
     def batch(self, calls: list) -> list:
         """Execute multiple RPC calls in a batch."""
-        payload = []
+        # The batch array is serialized straight into one growing buffer
+        # from the cached per-method body prefixes; no list of payload
+        # dicts is materialized first.
+        buf = bytearray(b"[")
         for i, call in enumerate(calls):
-            payload.append({
-                "jsonrpc": "2.0",
-                "id": i + 1,
-                "method": call["method"],
-                "params": call.get("params", [])
-            })
-        
-        response = self.session.post(
-            f"{self.base_url}/rpc",
-            json=payload,
-            timeout=self.timeout
-        )
+            if i:
+                buf += b","
+            buf += _param_body(call["method"], i + 1, call.get("params", []))
+        buf += b"]"
+
+        response = self.client.post(self._rpc_url, content=bytes(buf))
         response.raise_for_status()
-        
-        results = response.json()
+
+        results = _loads(response.content)
         return [r.get("result") for r in results]
\ No newline at end of file
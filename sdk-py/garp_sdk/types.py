@@ -1,16 +1,15 @@
 from typing import List, Optional
-from dataclasses import dataclass
 
+from msgspec import Struct
 
-@dataclass
-class BlockTx:
+
+class BlockTx(Struct, gc=False):
     id: str
     submitter: Optional[str] = None
     command_type: Optional[str] = None
 
 
-@dataclass
-class BlockInfo:
+class BlockInfo(Struct, gc=False):
     slot: int
     hash: str
     parent_hash: Optional[str] = None
@@ -19,10 +18,9 @@ class BlockInfo:
     transactions: Optional[List[BlockTx]] = None
 
 
-@dataclass
-class TransactionInfo:
+class TransactionInfo(Struct, gc=False):
     id: str
     submitter: Optional[str] = None
     status: Optional[str] = None
     created_at: Optional[int] = None
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None